@@ -7,17 +7,19 @@ MCP Server for Ticket Management System
 This server connects Claude desktop to the Ticket API service
 and performs ticket management operations.
 """
-import sys
 import os
-import datetime
+import re
+import asyncio
+import time
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from mcp.server.fastmcp import FastMCP, Context, Image
+from mcp.server.fastmcp import FastMCP, Context
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Union
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -30,11 +32,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger('mcp_ticket_server')
 
+# Runtime mode is fixed for the lifetime of the process, so resolve it once
+_NODE_ENV = os.environ.get('NODE_ENV', 'development')
+_IS_PROD = _NODE_ENV == 'production'
+_BASE_HEADERS = {'Content-Type': 'application/json'}
+
+# (connect, read) timeout in seconds for API requests, so a hung backend can't stall a tool call forever
+_API_TIMEOUT = (3.05, 10)
+
+# Helper function to create the shared API session
+def create_api_session() -> requests.Session:
+    """Create a pooled HTTP session with retries for transient gateway errors"""
+    session = requests.Session()
+    # Only reads are retried; POST/PUT also write history entries and must not be replayed
+    retry = Retry(
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(['HEAD', 'GET']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(_BASE_HEADERS)
+    return session
+
 # API configuration
-@dataclass
+@dataclass(slots=True)
 class AppContext:
     api_base_url: str
     api_key: Optional[str] = None
+    session: Optional[requests.Session] = None
+    master_cache: Dict[tuple, tuple] = field(default_factory=dict)
+    master_inflight: Dict[tuple, asyncio.Task] = field(default_factory=dict)
+    master_generation: int = 0
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
@@ -43,26 +75,53 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     api_base_url = os.environ.get('API_BASE_URL', 'http://localhost:8080')
     api_key = os.environ.get('API_KEY')
     
-    logger.info(f"Using API base URL: {api_base_url}")
+    logger.info("Using API base URL: %s", api_base_url)
     if api_key:
         logger.info("API key configured for authentication")
     else:
         logger.warning("API_KEY not configured - requests may fail if API requires authentication")
+    if _NODE_ENV == 'development':
+        logger.info("Development mode: API key authentication skipped")
+    
+    # Share one HTTP session (and its keep-alive connection pool) across all tool calls
+    session = create_api_session()
+    
+    # Headers only depend on the API key and runtime mode, so attach them to the session once;
+    # the API key is only sent in production environment
+    if _IS_PROD and api_key:
+        session.headers['x-api-key'] = api_key
+    
+    app_context = AppContext(api_base_url=api_base_url, api_key=api_key, session=session)
+    
+    # Test API connection in the background so the server can accept requests immediately
+    startup_task = asyncio.create_task(_check_api_connection(app_context))
     
-    # Test API connection
     try:
-        headers = {'x-api-key': api_key} if api_key else {}
-        response = requests.get(f"{api_base_url}/health", headers=headers)
+        yield app_context
+    finally:
+        logger.info("Shutting down API connection")
+        # Stop the startup probe and any master-data requests before closing their session
+        pending = [startup_task, *app_context.master_inflight.values()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        session.close()
+
+async def _check_api_connection(app_context: AppContext) -> None:
+    """Probe the API health endpoint and warm the master-data cache once it responds"""
+    api_base_url = app_context.api_base_url
+    try:
+        headers = {'x-api-key': app_context.api_key} if app_context.api_key else {}
+        # Run the blocking request in a worker thread so the event loop is not stalled
+        response = await asyncio.to_thread(app_context.session.get, f"{api_base_url}/health", headers=headers, timeout=_API_TIMEOUT)
         response.raise_for_status()  # Raise exception for non-200 status codes
-        logger.info(f"Successfully connected to API at {api_base_url}")
+        logger.info("Successfully connected to API at %s", api_base_url)
     except Exception as e:
-        logger.warning(f"Failed to connect to API at {api_base_url}: {str(e)}")
+        logger.warning("Failed to connect to API at %s: %s", api_base_url, e)
         logger.warning("API operations may fail if the connection is not available")
+        return
     
-    try:
-        yield AppContext(api_base_url=api_base_url, api_key=api_key)
-    finally:
-        logger.info("Shutting down API connection")
+    await _prefetch_master_data(app_context)
 
 # Configure MCP server with lifespan
 # Explicitly specify log level in uppercase
@@ -73,24 +132,301 @@ mcp = FastMCP(
     log_level="INFO"  # Directly specified with uppercase literal
 )
 
-# Helper function to get API headers
-def get_api_headers(ctx: Context) -> Dict[str, str]:
-    """Get headers for API requests including authentication"""
-    headers = {'Content-Type': 'application/json'}
+# Master data changes rarely, so rendered master-data tool output is cached for a short time.
+# The cache is only touched from coroutines on the event loop (never from to_thread workers),
+# so it needs no lock.
+_DEFAULT_MASTER_CACHE_TTL = 300.0
+try:
+    _MASTER_CACHE_TTL = float(os.environ.get('MASTER_CACHE_TTL', _DEFAULT_MASTER_CACHE_TTL))
+except ValueError:
+    logger.warning("Invalid MASTER_CACHE_TTL %r - using %s seconds", os.environ.get('MASTER_CACHE_TTL'), _DEFAULT_MASTER_CACHE_TTL)
+    _MASTER_CACHE_TTL = _DEFAULT_MASTER_CACHE_TTL
+# Upper bound on cached tables; filtered lookups (role, categoryId) each add an entry
+_MASTER_CACHE_MAXSIZE = 64
+
+def _get_master_cache(lifespan_context: AppContext, key: tuple) -> Optional[str]:
+    """Return cached master-data output for key, or None if missing or expired"""
+    entry = lifespan_context.master_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _set_master_cache(lifespan_context: AppContext, key: tuple, value: str) -> None:
+    """Store master-data output for key until the TTL expires, keeping the cache bounded"""
+    if _MASTER_CACHE_TTL <= 0:
+        return
     
-    # Only add API key in production environment
-    node_env = os.environ.get('NODE_ENV', 'development')
-    if node_env == 'production' and hasattr(ctx.request_context.lifespan_context, 'api_key') and ctx.request_context.lifespan_context.api_key:
-        headers['x-api-key'] = ctx.request_context.lifespan_context.api_key
-    elif node_env == 'development':
-        logger.info("Development mode: API key authentication skipped")
+    cache = lifespan_context.master_cache
+    now = time.monotonic()
+    
+    # Purge expired entries, then evict the oldest entries while the cache is full
+    for expired_key in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+        del cache[expired_key]
+    cache.pop(key, None)
+    while len(cache) >= _MASTER_CACHE_MAXSIZE:
+        del cache[next(iter(cache))]
+    
+    cache[key] = (now + _MASTER_CACHE_TTL, value)
+
+def _clear_master_cache(lifespan_context: AppContext) -> None:
+    """Drop all cached master-data output and detach requests started before the clear"""
+    lifespan_context.master_cache.clear()
+    lifespan_context.master_inflight.clear()
+    # Requests still in flight belong to an older generation and must not repopulate the cache
+    lifespan_context.master_generation += 1
+
+@dataclass(frozen=True, slots=True)
+class MasterTable:
+    """How one master-data endpoint is fetched and rendered as a Markdown table"""
+    endpoint: str
+    header: str
+    row_template: str
+    empty_message: str
+
+def _master_cache_key(table: MasterTable, param: Optional[str] = None) -> tuple:
+    """Cache key for a master-data table; a missing and an empty filter share one entry"""
+    return (table.endpoint, param or None)
+
+async def _fetch_master_table(
+    lifespan_context: AppContext,
+    table: MasterTable,
+    cache_key: tuple,
+    params: Optional[Dict[str, str]] = None
+) -> str:
+    """Return the rendered master-data table, fetching it from the API on a cache miss"""
+    cached = _get_master_cache(lifespan_context, cache_key)
+    if cached is not None:
+        return cached
+    
+    # Concurrent misses for the same table share one in-flight API request
+    inflight = lifespan_context.master_inflight
+    task = inflight.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_request_master_table(
+            lifespan_context, table, cache_key, params, lifespan_context.master_generation
+        ))
+        inflight[cache_key] = task
+        task.add_done_callback(lambda done: _forget_master_request(inflight, cache_key, done))
+    
+    # Shield the shared request so one cancelled caller doesn't cancel it for the others
+    return await asyncio.shield(task)
+
+def _forget_master_request(inflight: Dict[tuple, asyncio.Task], cache_key: tuple, task: asyncio.Task) -> None:
+    """Remove a finished master-data request, unless a newer request already took its key"""
+    if inflight.get(cache_key) is task:
+        del inflight[cache_key]
+    # Retrieve the exception so it isn't reported as never retrieved when every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
+
+async def _request_master_table(
+    lifespan_context: AppContext,
+    table: MasterTable,
+    cache_key: tuple,
+    params: Optional[Dict[str, str]] = None,
+    generation: int = 0
+) -> str:
+    """Fetch a master-data table from the API, render it and store it in the cache"""
+    # Make API request
+    response = await asyncio.to_thread(
+        lifespan_context.session.get,
+        f"{lifespan_context.api_base_url}/tickets/master/{table.endpoint}",
+        params=params,
+        timeout=_API_TIMEOUT
+    )
+    response.raise_for_status()
     
-    return headers
+    # Empty lists need no JSON decoding
+    items = None if response.content == b'[]' else response.json()
+    
+    # Format as markdown (empty tables are cached too, so they aren't re-fetched on every call)
+    if not items:
+        output = table.empty_message
+    else:
+        parts = [table.header]
+        row = table.row_template.format_map
+        parts.extend(row(_Defaulted(item)) for item in items)
+        output = "".join(parts)
+    
+    # Don't cache output fetched before invalidate_master_cache cleared the cache
+    if generation == lifespan_context.master_generation:
+        _set_master_cache(lifespan_context, cache_key, output)
+    return output
+
+async def _prefetch_master_data(lifespan_context: AppContext) -> None:
+    """Warm the master-data cache by fetching every master table concurrently"""
+    if _MASTER_CACHE_TTL <= 0:
+        return
+    
+    names = list(_MASTER_TABLES)
+    results = await asyncio.gather(
+        *(_fetch_master_table(lifespan_context, table, _master_cache_key(table)) for table in _MASTER_TABLES.values()),
+        return_exceptions=True
+    )
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to prefetch %s master data: %s", name, result)
+
+# Static Markdown table headers for the list tools
+_TICKET_LIST_HEADER = (
+    "# Ticket List\n\n"
+    "| ID | Reception Date | Account/Requestor | Category/Detail | Summary | Person in Charge | Status | Scheduled Date/Remaining |\n"
+    "|---|---|---|---|---|---|---|---|\n"
+)
+_USER_LIST_HEADER = "# User List\n\n| ID | Name | Email Address | Role |\n|---|---|---|---|\n"
+_ACCOUNT_LIST_HEADER = "# Account List\n\n| ID | Account Name |\n|---|---|\n"
+_CATEGORY_LIST_HEADER = "# Category List\n\n| ID | Category Name |\n|---|---|\n"
+_CATEGORY_DETAIL_LIST_HEADER = "# Category Detail List\n\n| ID | Detail Name | Parent Category |\n|---|---|---|\n"
+_STATUS_LIST_HEADER = "# Status List\n\n| ID | Status Name |\n|---|---|\n"
+_REQUEST_CHANNEL_LIST_HEADER = "# Request Channel List\n\n| ID | Channel Name |\n|---|---|\n"
+
+# Master-data endpoints and their Markdown row templates, keyed by the same names get_master_data accepts
+_MASTER_TABLES = {
+    'users': MasterTable(
+        'users', _USER_LIST_HEADER,
+        "| {id} | {name} | {email} | {role} |\n",
+        "No users registered."
+    ),
+    'accounts': MasterTable(
+        'accounts', _ACCOUNT_LIST_HEADER,
+        "| {id} | {name} |\n",
+        "No accounts registered."
+    ),
+    'categories': MasterTable(
+        'categories', _CATEGORY_LIST_HEADER,
+        "| {id} | {name} |\n",
+        "No categories registered."
+    ),
+    'categoryDetails': MasterTable(
+        'category-details', _CATEGORY_DETAIL_LIST_HEADER,
+        "| {id} | {name} | {categoryName} |\n",
+        "No category details registered."
+    ),
+    'statuses': MasterTable(
+        'statuses', _STATUS_LIST_HEADER,
+        "| {id} | {name} |\n",
+        "No statuses registered."
+    ),
+    'requestChannels': MasterTable(
+        'request-channels', _REQUEST_CHANNEL_LIST_HEADER,
+        "| {id} | {name} |\n",
+        "No request channels registered."
+    ),
+}
+
+# Markdown row template for get_ticket_list
+_TICKET_ROW_TEMPLATE = (
+    "| {ticketId} | {receptionDateTime} | {accountName}/{requestorName} | "
+    "{categoryName}/{categoryDetailName} | {summary} | "
+    "{personInChargeName} | {statusName} | {scheduled} |\n"
+)
+
+class _Defaulted(dict):
+    """Mapping for str.format_map that renders missing fields as empty strings"""
+    def __missing__(self, key: str) -> str:
+        return ''
+
+# Helper function to render the changed fields of a history entry
+def _render_changed_fields(changed_fields: List[Dict[str, Any]]) -> str:
+    """Render the changed fields of a ticket history entry as a Markdown list"""
+    if not changed_fields:
+        return ""
+    
+    return "Changed fields:\n" + "".join([
+        f"- {changed.get('fieldName', 'Unknown')}: {changed.get('oldValue', '')} → {changed.get('newValue', '')}\n"
+        for changed in changed_fields
+    ]) + "\n"
+
+# Helper function to render the get_ticket_detail report
+def _format_ticket_detail_report(ticket: Dict[str, Any], history_entries: List[Dict[str, Any]]) -> str:
+    """Render a ticket and its history as a Markdown report"""
+    parts = [f"# Ticket Details: {ticket.get('id')}\n\n"]
+    
+    parts.append("## Reception Information\n\n")
+    parts.append(f"- **Reception Date/Time**: {ticket.get('receptionDateTime', 'Not set')}\n")
+    parts.append(f"- **Account**: {ticket.get('accountName', 'Not set')}\n")
+    parts.append(f"- **Requestor**: {ticket.get('requestorName', 'Not set')}\n")
+    parts.append(f"- **Category**: {ticket.get('categoryName', 'Not set')}\n")
+    parts.append(f"- **Category Detail**: {ticket.get('categoryDetailName', 'Not set')}\n")
+    parts.append(f"- **Request Channel**: {ticket.get('requestChannelName', 'Not set')}\n")
+    parts.append(f"- **Summary**: {ticket.get('summary', 'Not set')}\n")
+    parts.append(f"- **Description**:\n\n{ticket.get('description', 'Not set')}\n\n")
+    
+    # Add attachments if any
+    attachments = ticket.get('attachments', [])
+    if attachments:
+        parts.append("- **Attachments**:\n")
+        for attachment in attachments:
+            file_name = attachment.get('fileName', 'Unknown file')
+            file_url = attachment.get('fileUrl', '#')
+            parts.append(f"  - [{file_name}]({file_url})\n")
+    else:
+        parts.append("- **Attachments**: None\n")
+    
+    parts.append("\n## Response Information\n\n")
+    parts.append(f"- **Person in Charge**: {ticket.get('personInChargeName', 'Not set')}\n")
+    parts.append(f"- **Scheduled Completion Date**: {ticket.get('scheduledCompletionDate', 'Not set')}\n")
+    parts.append(f"- **Status**: {ticket.get('statusName', 'Not set')}\n")
+    parts.append(f"- **Completion Date**: {ticket.get('completionDate', 'Not completed')}\n")
+    parts.append(f"- **Actual Effort Hours**: {ticket.get('actualEffortHours', 'Not set')} hours\n")
+    parts.append(f"- **Response Category**: {ticket.get('responseCategoryName', 'Not set')}\n")
+    
+    response_details = ticket.get('responseDetails', '')
+    parts.append("- **Response Details**:\n\n")
+    parts.append(f"{response_details if response_details else 'Not set'}\n\n")
+    
+    parts.append(f"- **Has Defect**: {'Yes' if ticket.get('hasDefect') else 'No'}\n")
+    parts.append(f"- **External Ticket**: {ticket.get('externalTicketId', 'Not set')}\n")
+    parts.append(f"- **Remarks**: {ticket.get('remarks', 'Not set')}\n\n")
+    
+    # Add history
+    parts.append("## Response History\n\n")
+    if history_entries:
+        parts.extend([
+            f"### {entry.get('timestamp')} - {entry.get('userName', 'Unknown')}\n\n"
+            f"{entry.get('comment', '')}\n\n"
+            f"{_render_changed_fields(entry.get('changedFields', []))}"
+            for entry in history_entries
+        ])
+    else:
+        parts.append("No history available.\n")
+    
+    return "".join(parts)
+
+# Accepted input formats for ticket dates
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?$')
+
+# Sort options accepted by the ticket list API (camelCase names are mapped to columns by the API)
+_SORT_FIELDS = frozenset((
+    'receptionDateTime', 'scheduledCompletionDate', 'completionDate',
+    'reception_date_time', 'scheduled_completion_date', 'completion_date'
+))
+_SORT_ORDERS = frozenset(('asc', 'desc'))
+
+# Helper function to validate optional date parameters
+def _validate_dates(**dates: Optional[str]) -> Optional[str]:
+    """Return an error message for the first date not in YYYY-MM-DD format, or None"""
+    for name, value in dates.items():
+        if value and not _DATE_RE.match(value):
+            return f"Invalid {name} format. Use YYYY-MM-DD"
+    return None
+
+# Helper function to compare a current ticket field with a requested value
+def _is_same_value(current: Any, value: Any) -> bool:
+    """Check whether an update value matches the current ticket value"""
+    # Numeric columns (e.g. actualEffortHours) may come back from the API as strings
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            return float(current) == float(value)
+        except (TypeError, ValueError):
+            return False
+    return current == value
 
 # === Tools ===
 
 @mcp.tool(description="Get ticket list - Display list of tickets according to search criteria")
-def get_ticket_list(
+async def get_ticket_list(
     personInChargeId: Optional[str] = None,
     accountId: Optional[str] = None,
     statusId: Optional[str] = None,
@@ -115,7 +451,7 @@ def get_ticket_list(
     - scheduledCompletionDateTo: Scheduled completion date end (YYYY-MM-DD format)
     - showCompleted: Whether to show completed tickets (default: True)
     - searchQuery: Search keyword (searches in summary, account name, requestor name)
-    - sortBy: Field to sort by (default: "receptionDateTime")
+    - sortBy: Field to sort by ("receptionDateTime", "scheduledCompletionDate" or "completionDate", default: "receptionDateTime")
     - sortOrder: Sort order ("asc" or "desc", default: "desc")
     - limit: Maximum number of results to return (default: 20)
     - offset: Starting position (for pagination, default: 0)
@@ -129,31 +465,35 @@ def get_ticket_list(
     3. Keyword search: get_ticket_list(searchQuery="error")
     4. Date range specification: get_ticket_list(scheduledCompletionDateFrom="2023-01-01", scheduledCompletionDateTo="2023-12-31")
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    # Reject unknown sort options before making any request
+    if sortBy and sortBy not in _SORT_FIELDS:
+        return f"Invalid sortBy: {sortBy}. Use receptionDateTime, scheduledCompletionDate or completionDate"
+    if sortOrder and sortOrder not in _SORT_ORDERS:
+        return f"Invalid sortOrder: {sortOrder}. Use asc or desc"
     
-    # Prepare query parameters
-    params = {
-        'personInChargeId': personInChargeId,
-        'accountId': accountId,
-        'statusId': statusId,
-        'scheduledCompletionDateFrom': scheduledCompletionDateFrom,
-        'scheduledCompletionDateTo': scheduledCompletionDateTo,
-        'showCompleted': 'true' if showCompleted else 'false',
-        'searchQuery': searchQuery,
-        'sortBy': sortBy,
-        'sortOrder': sortOrder,
-        'limit': limit,
-        'offset': offset
-    }
+    # Get API base URL and shared HTTP session
+    lifespan_context = ctx.request_context.lifespan_context
+    api_base_url = lifespan_context.api_base_url
+    session = lifespan_context.session
     
-    # Remove None values
-    params = {k: v for k, v in params.items() if v is not None}
+    # Prepare query parameters (excluding None values)
+    params = {k: v for k, v in (
+        ('personInChargeId', personInChargeId),
+        ('accountId', accountId),
+        ('statusId', statusId),
+        ('scheduledCompletionDateFrom', scheduledCompletionDateFrom),
+        ('scheduledCompletionDateTo', scheduledCompletionDateTo),
+        ('showCompleted', 'true' if showCompleted else 'false'),
+        ('searchQuery', searchQuery),
+        ('sortBy', sortBy),
+        ('sortOrder', sortOrder),
+        ('limit', limit),
+        ('offset', offset)
+    ) if v is not None}
     
     try:
-        # Make API request with authentication headers
-        headers = get_api_headers(ctx)
-        response = requests.get(f"{api_base_url}/tickets", params=params, headers=headers)
+        # Make API request (authentication headers come from the shared session)
+        response = await asyncio.to_thread(session.get, f"{api_base_url}/tickets", params=params, timeout=_API_TIMEOUT)
         response.raise_for_status()  # Raise exception for non-200 status codes
         
         # Parse response
@@ -163,19 +503,15 @@ def get_ticket_list(
         if not tickets:
             return "No tickets found matching the criteria."
         
-        output = "# Ticket List\n\n"
-        output += "| ID | Reception Date | Account/Requestor | Category/Detail | Summary | Person in Charge | Status | Scheduled Date/Remaining |\n"
-        output += "|---|---|---|---|---|---|---|---|\n"
+        parts = [_TICKET_LIST_HEADER]
         
         for t in tickets:
             remaining = f"{t.get('remainingDays')} days left" if t.get('remainingDays') is not None else ""
             scheduled = f"{t.get('scheduledCompletionDate')} {remaining}" if t.get('scheduledCompletionDate') else ""
             
-            output += f"| {t.get('ticketId')} | {t.get('receptionDateTime')} | {t.get('accountName')}/{t.get('requestorName')} | "
-            output += f"{t.get('categoryName')}/{t.get('categoryDetailName')} | {t.get('summary')} | "
-            output += f"{t.get('personInChargeName')} | {t.get('statusName')} | {scheduled} |\n"
+            parts.append(_TICKET_ROW_TEMPLATE.format_map(_Defaulted(t, scheduled=scheduled)))
         
-        return output
+        return "".join(parts)
     
     except requests.exceptions.RequestException as e:
         return f"API request error: {str(e)}"
@@ -183,7 +519,7 @@ def get_ticket_list(
         return f"An error occurred: {str(e)}"
 
 @mcp.tool(description="Get ticket details - Display detailed information for a specific ticket ID")
-def get_ticket_detail(
+async def get_ticket_detail(
     ticketId: str,
     ctx: Context = None
 ) -> str:
@@ -206,88 +542,29 @@ def get_ticket_detail(
     - Returns an error message if the specified ticket ID doesn't exist
     - History is displayed in newest first order
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    # Get API base URL and shared HTTP session
+    lifespan_context = ctx.request_context.lifespan_context
+    api_base_url = lifespan_context.api_base_url
+    session = lifespan_context.session
     
     try:
-        # Get headers for API requests
-        headers = get_api_headers(ctx)
-        
-        # Get ticket details
-        detail_response = requests.get(f"{api_base_url}/tickets/{ticketId}", headers=headers)
+        # Get ticket details and history concurrently - the two requests are independent
+        detail_response, history_response = await asyncio.gather(
+            asyncio.to_thread(session.get, f"{api_base_url}/tickets/{ticketId}", timeout=_API_TIMEOUT),
+            asyncio.to_thread(session.get, f"{api_base_url}/tickets/{ticketId}/history", timeout=_API_TIMEOUT)
+        )
         detail_response.raise_for_status()
         
         # Parse ticket data
         ticket = detail_response.json()
         
-        # Get ticket history
-        history_response = requests.get(f"{api_base_url}/tickets/{ticketId}/history", headers=headers)
         history_response.raise_for_status()
         
         # Parse history data
         history_entries = history_response.json()
         
         # Format as markdown
-        output = f"# Ticket Details: {ticket.get('id')}\n\n"
-        
-        output += "## Reception Information\n\n"
-        output += f"- **Reception Date/Time**: {ticket.get('receptionDateTime', 'Not set')}\n"
-        output += f"- **Account**: {ticket.get('accountName', 'Not set')}\n"
-        output += f"- **Requestor**: {ticket.get('requestorName', 'Not set')}\n"
-        output += f"- **Category**: {ticket.get('categoryName', 'Not set')}\n"
-        output += f"- **Category Detail**: {ticket.get('categoryDetailName', 'Not set')}\n"
-        output += f"- **Request Channel**: {ticket.get('requestChannelName', 'Not set')}\n"
-        output += f"- **Summary**: {ticket.get('summary', 'Not set')}\n"
-        output += f"- **Description**:\n\n{ticket.get('description', 'Not set')}\n\n"
-        
-        # Add attachments if any
-        attachments = ticket.get('attachments', [])
-        if attachments:
-            output += "- **Attachments**:\n"
-            for attachment in attachments:
-                file_name = attachment.get('fileName', 'Unknown file')
-                file_url = attachment.get('fileUrl', '#')
-                output += f"  - [{file_name}]({file_url})\n"
-        else:
-            output += "- **Attachments**: None\n"
-        
-        output += "\n## Response Information\n\n"
-        output += f"- **Person in Charge**: {ticket.get('personInChargeName', 'Not set')}\n"
-        output += f"- **Scheduled Completion Date**: {ticket.get('scheduledCompletionDate', 'Not set')}\n"
-        output += f"- **Status**: {ticket.get('statusName', 'Not set')}\n"
-        output += f"- **Completion Date**: {ticket.get('completionDate', 'Not completed')}\n"
-        output += f"- **Actual Effort Hours**: {ticket.get('actualEffortHours', 'Not set')} hours\n"
-        output += f"- **Response Category**: {ticket.get('responseCategoryName', 'Not set')}\n"
-        
-        response_details = ticket.get('responseDetails', '')
-        output += "- **Response Details**:\n\n"
-        output += f"{response_details if response_details else 'Not set'}\n\n"
-        
-        output += f"- **Has Defect**: {'Yes' if ticket.get('hasDefect') else 'No'}\n"
-        output += f"- **External Ticket**: {ticket.get('externalTicketId', 'Not set')}\n"
-        output += f"- **Remarks**: {ticket.get('remarks', 'Not set')}\n\n"
-        
-        # Add history
-        output += "## Response History\n\n"
-        if history_entries:
-            for entry in history_entries:
-                output += f"### {entry.get('timestamp')} - {entry.get('userName', 'Unknown')}\n\n"
-                output += f"{entry.get('comment', '')}\n\n"
-                
-                # Add changed fields if any
-                changed_fields = entry.get('changedFields', [])
-                if changed_fields:
-                    output += "Changed fields:\n"
-                    for field in changed_fields:
-                        field_name = field.get('fieldName', 'Unknown')
-                        old_value = field.get('oldValue', '')
-                        new_value = field.get('newValue', '')
-                        output += f"- {field_name}: {old_value} → {new_value}\n"
-                    output += "\n"
-        else:
-            output += "No history available.\n"
-        
-        return output
+        return _format_ticket_detail_report(ticket, history_entries)
     
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
@@ -297,7 +574,7 @@ def get_ticket_detail(
         return f"An error occurred: {str(e)}"
 
 @mcp.tool(description="Create a new ticket - Register a new ticket with the required information")
-def create_ticket(
+async def create_ticket(
     receptionDateTime: str,
     requestorId: str,
     accountId: str,
@@ -323,7 +600,7 @@ def create_ticket(
     Register a new ticket in the system
 
     Parameters:
-    - receptionDateTime: Reception date/time (ISO 8601 format: YYYY-MM-DDThh:mm:ss)
+    - receptionDateTime: Reception date/time (YYYY-MM-DDThh:mm:ss or YYYY-MM-DD hh:mm as returned by get_ticket_list)
     - requestorId: Requestor ID (reference users collection, can be checked with get_users)
     - accountId: Account ID (reference accounts collection, can be checked with get_accounts)
     - categoryId: Category ID (reference categories collection, can be checked with get_categories)
@@ -370,35 +647,57 @@ def create_ticket(
     Notes:
     - Ticket number (ticketId) is automatically assigned ("TCK-XXXX" format)
     - A comment "New ticket created" is automatically added to the history when created
-    - An error is returned if any required fields are missing
+    - An error is returned if any required fields are missing or dates are not in the formats above
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    # Get API base URL and shared HTTP session
+    lifespan_context = ctx.request_context.lifespan_context
+    api_base_url = lifespan_context.api_base_url
+    session = lifespan_context.session
     
-    # Prepare request data
-    ticket_data = {
-        'receptionDateTime': receptionDateTime,
-        'requestorId': requestorId,
-        'accountId': accountId,
-        'categoryId': categoryId,
-        'categoryDetailId': categoryDetailId,
-        'requestChannelId': requestChannelId,
-        'summary': summary,
-        'description': description,
-        'personInChargeId': personInChargeId,
-        'statusId': statusId,
-        'scheduledCompletionDate': scheduledCompletionDate,
-        'completionDate': completionDate,
-        'actualEffortHours': actualEffortHours,
-        'responseCategoryId': responseCategoryId,
-        'responseDetails': responseDetails,
-        'hasDefect': hasDefect,
-        'externalTicketId': externalTicketId,
-        'remarks': remarks
-    }
+    # Validate input locally so obviously bad requests fail without an API round trip
+    missing = [name for name, value in (
+        ('receptionDateTime', receptionDateTime),
+        ('requestorId', requestorId),
+        ('accountId', accountId),
+        ('categoryId', categoryId),
+        ('categoryDetailId', categoryDetailId),
+        ('requestChannelId', requestChannelId),
+        ('summary', summary),
+        ('description', description),
+        ('personInChargeId', personInChargeId),
+        ('statusId', statusId)
+    ) if not value]
+    if missing:
+        return {"error": f"Missing required fields: {', '.join(missing)}"}
+    
+    if not _DATETIME_RE.match(receptionDateTime):
+        return {"error": "Invalid receptionDateTime format. Use YYYY-MM-DDThh:mm:ss or YYYY-MM-DD hh:mm"}
     
-    # Remove None values
-    ticket_data = {k: v for k, v in ticket_data.items() if v is not None}
+    date_error = _validate_dates(scheduledCompletionDate=scheduledCompletionDate, completionDate=completionDate)
+    if date_error:
+        return {"error": date_error}
+    
+    # Prepare request data (excluding None values)
+    ticket_data = {k: v for k, v in (
+        ('receptionDateTime', receptionDateTime),
+        ('requestorId', requestorId),
+        ('accountId', accountId),
+        ('categoryId', categoryId),
+        ('categoryDetailId', categoryDetailId),
+        ('requestChannelId', requestChannelId),
+        ('summary', summary),
+        ('description', description),
+        ('personInChargeId', personInChargeId),
+        ('statusId', statusId),
+        ('scheduledCompletionDate', scheduledCompletionDate),
+        ('completionDate', completionDate),
+        ('actualEffortHours', actualEffortHours),
+        ('responseCategoryId', responseCategoryId),
+        ('responseDetails', responseDetails),
+        ('hasDefect', hasDefect),
+        ('externalTicketId', externalTicketId),
+        ('remarks', remarks)
+    ) if v is not None}
     
     # Add attachments if provided
     if attachments:
@@ -406,12 +705,11 @@ def create_ticket(
     
     try:
         # Make API request
-        headers = get_api_headers(ctx)
-        headers['Content-Type'] = 'application/json'
-        response = requests.post(
+        response = await asyncio.to_thread(
+            session.post,
             f"{api_base_url}/tickets",
             json=ticket_data,
-            headers=headers
+            timeout=_API_TIMEOUT
         )
         response.raise_for_status()
         
@@ -438,11 +736,14 @@ def create_ticket(
     except Exception as e:
         return {"error": f"An error occurred: {str(e)}"}
 
+# Comment recorded by update_ticket when the caller doesn't give one
+_DEFAULT_UPDATE_COMMENT = "Ticket updated"
+
 @mcp.tool(description="Update existing ticket - Update ticket information by specifying ticket ID and updated content")
-def update_ticket(
+async def update_ticket(
     ticketId: str,
     updatedById: str,
-    comment: Optional[str] = "Ticket updated",
+    comment: Optional[str] = _DEFAULT_UPDATE_COMMENT,
     requestorId: Optional[str] = None,
     accountId: Optional[str] = None,
     categoryId: Optional[str] = None,
@@ -460,6 +761,7 @@ def update_ticket(
     hasDefect: Optional[bool] = None,
     externalTicketId: Optional[str] = None,
     remarks: Optional[str] = None,
+    skipIfUnchanged: Optional[bool] = False,
     ctx: Context = None
 ) -> Dict[str, str]:
     """
@@ -489,6 +791,9 @@ def update_ticket(
     - externalTicketId: External ticket number
     - remarks: Remarks
 
+    Options:
+    - skipIfUnchanged: Check the current ticket first and skip the update if all specified fields already have the given values (default: False)
+
     Returns:
     - Dictionary containing the result:
       - Success: {"id": "updated ticket ID", "message": "Ticket updated. (ID: ticketID)"}
@@ -520,9 +825,18 @@ def update_ticket(
     - Error if non-existent ticket ID is specified
     - Only the fields specified will be changed; unspecified fields remain unchanged
     - Update history is automatically recorded, and values before and after changes are saved
+    - With skipIfUnchanged=True, no update (and no history entry) is recorded when every specified field already has the given value;
+      calls that specify no fields, or that include their own comment, are always sent
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    # Get API base URL and shared HTTP session
+    lifespan_context = ctx.request_context.lifespan_context
+    api_base_url = lifespan_context.api_base_url
+    session = lifespan_context.session
+    
+    # Validate date formats locally so bad input fails without an API round trip
+    date_error = _validate_dates(scheduledCompletionDate=scheduledCompletionDate, completionDate=completionDate)
+    if date_error:
+        return {"error": date_error}
     
     # Prepare request data - only include fields that need to be updated
     update_data = {
@@ -531,24 +845,43 @@ def update_ticket(
     }
     
     # Add all update fields (excluding None values)
-    for field_name in [
-        'requestorId', 'accountId', 'categoryId', 'categoryDetailId', 'requestChannelId',
-        'summary', 'description', 'personInChargeId', 'statusId', 'scheduledCompletionDate',
-        'completionDate', 'actualEffortHours', 'responseCategoryId', 'responseDetails',
-        'hasDefect', 'externalTicketId', 'remarks'
-    ]:
-        value = locals()[field_name]
-        if value is not None:
-            update_data[field_name] = value
+    fields = (
+        ('requestorId', requestorId), ('accountId', accountId), ('categoryId', categoryId),
+        ('categoryDetailId', categoryDetailId), ('requestChannelId', requestChannelId),
+        ('summary', summary), ('description', description), ('personInChargeId', personInChargeId),
+        ('statusId', statusId), ('scheduledCompletionDate', scheduledCompletionDate),
+        ('completionDate', completionDate), ('actualEffortHours', actualEffortHours),
+        ('responseCategoryId', responseCategoryId), ('responseDetails', responseDetails),
+        ('hasDefect', hasDefect), ('externalTicketId', externalTicketId), ('remarks', remarks)
+    )
+    changes = [(k, v) for k, v in fields if v is not None]
+    update_data.update(changes)
     
     try:
+        # Skip the update entirely if the ticket already has the requested values;
+        # a call with no field changes, or with an explicit comment, is always sent to the API
+        explicit_comment = comment and comment != _DEFAULT_UPDATE_COMMENT
+        if skipIfUnchanged and changes and not explicit_comment:
+            current_response = await asyncio.to_thread(
+                session.get,
+                f"{api_base_url}/tickets/{ticketId}",
+                timeout=_API_TIMEOUT
+            )
+            current_response.raise_for_status()
+            current = current_response.json()
+            
+            if all(_is_same_value(current.get(k), v) for k, v in changes):
+                return {
+                    'id': ticketId,
+                    'message': f"No changes. Ticket not updated. (ID: {ticketId})"
+                }
+        
         # Make API request
-        headers = get_api_headers(ctx)
-        headers['Content-Type'] = 'application/json'
-        response = requests.put(
+        response = await asyncio.to_thread(
+            session.put,
             f"{api_base_url}/tickets/{ticketId}",
             json=update_data,
-            headers=headers
+            timeout=_API_TIMEOUT
         )
         response.raise_for_status()
         
@@ -579,7 +912,7 @@ def update_ticket(
         return {"error": f"An error occurred: {str(e)}"}
 
 @mcp.tool(description="Add comment or history to a ticket - Record ticket response history")
-def add_ticket_history(
+async def add_ticket_history(
     ticketId: str,
     userId: str,
     comment: str,
@@ -611,8 +944,10 @@ def add_ticket_history(
     - This tool is primarily intended for adding comments and recording history
     - The timestamp for the history is automatically set to the current time
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    # Get API base URL and shared HTTP session
+    lifespan_context = ctx.request_context.lifespan_context
+    api_base_url = lifespan_context.api_base_url
+    session = lifespan_context.session
     
     # Prepare request data
     history_data = {
@@ -622,12 +957,11 @@ def add_ticket_history(
     
     try:
         # Make API request
-        headers = get_api_headers(ctx)
-        headers['Content-Type'] = 'application/json'
-        response = requests.post(
+        response = await asyncio.to_thread(
+            session.post,
             f"{api_base_url}/tickets/{ticketId}/history",
             json=history_data,
-            headers=headers
+            timeout=_API_TIMEOUT
         )
         response.raise_for_status()
         
@@ -659,7 +993,7 @@ def add_ticket_history(
 
 # Master data reference tools
 @mcp.tool(description="Get user list - Reference user information needed for ticket creation")
-def get_users(
+async def get_users(
     role: Optional[str] = None,
     ctx: Context = None
 ) -> str:
@@ -681,8 +1015,8 @@ def get_users(
     - User IDs are needed as requestorId or personInChargeId when creating tickets
     - Displayed information: ID, name, email address, role
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    lifespan_context = ctx.request_context.lifespan_context
+    table = _MASTER_TABLES['users']
     
     # Prepare query parameters
     params = {}
@@ -690,25 +1024,7 @@ def get_users(
         params['role'] = role
     
     try:
-        # Make API request
-        response = requests.get(f"{api_base_url}/tickets/master/users", params=params, headers=get_api_headers(ctx))
-        response.raise_for_status()
-        
-        # Parse response
-        users = response.json()
-        
-        # Format as markdown
-        if not users:
-            return "No users registered."
-        
-        output = "# User List\n\n"
-        output += "| ID | Name | Email Address | Role |\n"
-        output += "|---|---|---|---|\n"
-        
-        for user in users:
-            output += f"| {user.get('id', '')} | {user.get('name', '')} | {user.get('email', '')} | {user.get('role', '')} |\n"
-        
-        return output
+        return await _fetch_master_table(lifespan_context, table, _master_cache_key(table, role), params)
     
     except requests.exceptions.RequestException as e:
         return f"API request error: {str(e)}"
@@ -716,7 +1032,7 @@ def get_users(
         return f"An error occurred: {str(e)}"
 
 @mcp.tool(description="Get account list - Reference account information needed for ticket creation")
-def get_accounts(ctx: Context = None) -> str:
+async def get_accounts(ctx: Context = None) -> str:
     """
     Retrieve and display a list of accounts (customer companies, etc.) registered in the system
 
@@ -731,29 +1047,11 @@ def get_accounts(ctx: Context = None) -> str:
     - Displayed information: ID, account name
     - Accounts are displayed sorted by account name
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    lifespan_context = ctx.request_context.lifespan_context
+    table = _MASTER_TABLES['accounts']
     
     try:
-        # Make API request
-        response = requests.get(f"{api_base_url}/tickets/master/accounts", headers=get_api_headers(ctx))
-        response.raise_for_status()
-        
-        # Parse response
-        accounts = response.json()
-        
-        # Format as markdown
-        if not accounts:
-            return "No accounts registered."
-        
-        output = "# Account List\n\n"
-        output += "| ID | Account Name |\n"
-        output += "|---|---|\n"
-        
-        for account in accounts:
-            output += f"| {account.get('id', '')} | {account.get('name', '')} |\n"
-        
-        return output
+        return await _fetch_master_table(lifespan_context, table, _master_cache_key(table))
     
     except requests.exceptions.RequestException as e:
         return f"API request error: {str(e)}"
@@ -761,7 +1059,7 @@ def get_accounts(ctx: Context = None) -> str:
         return f"An error occurred: {str(e)}"
 
 @mcp.tool(description="Get category list - Reference category information needed for ticket creation")
-def get_categories(ctx: Context = None) -> str:
+async def get_categories(ctx: Context = None) -> str:
     """
     Retrieve and display a list of ticket categories used in the system
 
@@ -776,29 +1074,11 @@ def get_categories(ctx: Context = None) -> str:
     - After selecting a category, retrieve related category details with get_category_details(categoryId="...")
     - Displayed information: ID, category name
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    lifespan_context = ctx.request_context.lifespan_context
+    table = _MASTER_TABLES['categories']
     
     try:
-        # Make API request
-        response = requests.get(f"{api_base_url}/tickets/master/categories", headers=get_api_headers(ctx))
-        response.raise_for_status()
-        
-        # Parse response
-        categories = response.json()
-        
-        # Format as markdown
-        if not categories:
-            return "No categories registered."
-        
-        output = "# Category List\n\n"
-        output += "| ID | Category Name |\n"
-        output += "|---|---|\n"
-        
-        for category in categories:
-            output += f"| {category.get('id', '')} | {category.get('name', '')} |\n"
-        
-        return output
+        return await _fetch_master_table(lifespan_context, table, _master_cache_key(table))
     
     except requests.exceptions.RequestException as e:
         return f"API request error: {str(e)}"
@@ -806,7 +1086,7 @@ def get_categories(ctx: Context = None) -> str:
         return f"An error occurred: {str(e)}"
 
 @mcp.tool(description="Get category detail list - Reference category detail information needed for ticket creation")
-def get_category_details(
+async def get_category_details(
     categoryId: Optional[str] = None,
     ctx: Context = None
 ) -> str:
@@ -828,8 +1108,8 @@ def get_category_details(
     - Category IDs can be checked with get_categories()
     - Displayed information: ID, detail name, parent category
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    lifespan_context = ctx.request_context.lifespan_context
+    table = _MASTER_TABLES['categoryDetails']
     
     # Prepare query parameters
     params = {}
@@ -837,25 +1117,7 @@ def get_category_details(
         params['categoryId'] = categoryId
     
     try:
-        # Make API request
-        response = requests.get(f"{api_base_url}/tickets/master/category-details", params=params, headers=get_api_headers(ctx))
-        response.raise_for_status()
-        
-        # Parse response
-        category_details = response.json()
-        
-        # Format as markdown
-        if not category_details:
-            return "No category details registered."
-        
-        output = "# Category Detail List\n\n"
-        output += "| ID | Detail Name | Parent Category |\n"
-        output += "|---|---|---|\n"
-        
-        for detail in category_details:
-            output += f"| {detail.get('id', '')} | {detail.get('name', '')} | {detail.get('categoryName', '')} |\n"
-        
-        return output
+        return await _fetch_master_table(lifespan_context, table, _master_cache_key(table, categoryId), params)
     
     except requests.exceptions.RequestException as e:
         return f"API request error: {str(e)}"
@@ -863,7 +1125,7 @@ def get_category_details(
         return f"An error occurred: {str(e)}"
 
 @mcp.tool(description="Get status list - Reference status information needed for ticket creation/update")
-def get_statuses(ctx: Context = None) -> str:
+async def get_statuses(ctx: Context = None) -> str:
     """
     Retrieve and display a list of ticket statuses used in the system
 
@@ -878,29 +1140,11 @@ def get_statuses(ctx: Context = None) -> str:
     - Displayed information: ID, status name
     - Statuses are displayed in typical workflow order
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    lifespan_context = ctx.request_context.lifespan_context
+    table = _MASTER_TABLES['statuses']
     
     try:
-        # Make API request
-        response = requests.get(f"{api_base_url}/tickets/master/statuses", headers=get_api_headers(ctx))
-        response.raise_for_status()
-        
-        # Parse response
-        statuses = response.json()
-        
-        # Format as markdown
-        if not statuses:
-            return "No statuses registered."
-        
-        output = "# Status List\n\n"
-        output += "| ID | Status Name |\n"
-        output += "|---|---|\n"
-        
-        for status in statuses:
-            output += f"| {status.get('id', '')} | {status.get('name', '')} |\n"
-        
-        return output
+        return await _fetch_master_table(lifespan_context, table, _master_cache_key(table))
     
     except requests.exceptions.RequestException as e:
         return f"API request error: {str(e)}"
@@ -908,7 +1152,7 @@ def get_statuses(ctx: Context = None) -> str:
         return f"An error occurred: {str(e)}"
 
 @mcp.tool(description="Get request channel list - Reference channel information needed for ticket creation")
-def get_request_channels(ctx: Context = None) -> str:
+async def get_request_channels(ctx: Context = None) -> str:
     """
     Retrieve and display a list of request channels used in the system
     
@@ -922,42 +1166,81 @@ def get_request_channels(ctx: Context = None) -> str:
     - Request channel IDs are needed as requestChannelId when creating tickets
     - Displayed information: ID, channel name
     """
-    # Get API base URL
-    api_base_url = ctx.request_context.lifespan_context.api_base_url
+    lifespan_context = ctx.request_context.lifespan_context
+    table = _MASTER_TABLES['requestChannels']
     
     try:
-        # Make API request
-        response = requests.get(f"{api_base_url}/tickets/master/request-channels", headers=get_api_headers(ctx))
-        response.raise_for_status()
-        
-        # Parse response
-        channels = response.json()
-        
-        # Format as markdown
-        if not channels:
-            return "No request channels registered."
-        
-        output = "# Request Channel List\n\n"
-        output += "| ID | Channel Name |\n"
-        output += "|---|---|\n"
-        
-        for channel in channels:
-            output += f"| {channel.get('id', '')} | {channel.get('name', '')} |\n"
-        
-        return output
+        return await _fetch_master_table(lifespan_context, table, _master_cache_key(table))
     
     except requests.exceptions.RequestException as e:
         return f"API request error: {str(e)}"
     except Exception as e:
         return f"An error occurred: {str(e)}"
 
+# Master data tools available through get_master_data
+_MASTER_DATA_TOOLS = {
+    'users': get_users,
+    'accounts': get_accounts,
+    'categories': get_categories,
+    'categoryDetails': get_category_details,
+    'statuses': get_statuses,
+    'requestChannels': get_request_channels
+}
+
+@mcp.tool(description="Get master data - Reference several master data lists needed for ticket creation in one call")
+async def get_master_data(
+    include: Optional[List[str]] = None,
+    ctx: Context = None
+) -> str:
+    """
+    Retrieve and display several master data lists at once
+
+    Parameters:
+    - include: Master data lists to include (optional, default: all)
+      Available values: "users", "accounts", "categories", "categoryDetails", "statuses", "requestChannels"
+
+    Returns:
+    - One Markdown document containing a table for each requested list
+
+    Usage examples:
+    1. Display all master data: get_master_data()
+    2. Display only users and statuses: get_master_data(include=["users", "statuses"])
+
+    Notes:
+    - The lists are fetched concurrently, so this is faster than calling each master data tool in turn
+    - Use this before create_ticket to look up all the IDs it needs
+    """
+    sections = include or list(_MASTER_DATA_TOOLS)
+    unknown = [name for name in sections if name not in _MASTER_DATA_TOOLS]
+    if unknown:
+        return f"Unknown master data: {', '.join(unknown)}. Available values: {', '.join(_MASTER_DATA_TOOLS)}"
+    
+    # Fetch all requested lists concurrently; each tool handles its own errors and caching
+    results = await asyncio.gather(*(_MASTER_DATA_TOOLS[name](ctx=ctx) for name in sections))
+    
+    return "\n".join(results)
+
+@mcp.tool(description="Clear master data cache - Make the next master data lookups fetch fresh data from the API")
+async def invalidate_master_cache(ctx: Context = None) -> str:
+    """
+    Clear cached master data lists (users, accounts, categories, category details, statuses, request channels)
+
+    Returns:
+    - Confirmation message
+
+    Usage examples:
+    1. Clear the cache after master data was changed: invalidate_master_cache()
+
+    Notes:
+    - Master data lists are cached for a few minutes; use this when a newly added user, account, etc. does not show up yet
+    """
+    _clear_master_cache(ctx.request_context.lifespan_context)
+    return "Master data cache cleared."
+
 # === Resources ===
 
-# Add a basic resource for documentation
-@mcp.resource("docs://overview")
-def get_overview_docs() -> str:
-    """Get overview documentation for the ticket system"""
-    return """
+# Overview documentation served by the docs://overview resource
+_OVERVIEW_DOCS = """
     # Ticket Management System MCP Server
 
     This server provides various ticket operations through the Ticket Management System API.
@@ -980,13 +1263,22 @@ def get_overview_docs() -> str:
     - **Category Detail List**: Retrieve category detail information registered in the system (`get_category_details`)
     - **Status List**: Retrieve status information registered in the system (`get_statuses`)
     - **Request Channel List**: Retrieve request channel information registered in the system (`get_request_channels`)
+    - **Master Data**: Retrieve several of the lists above in one call (`get_master_data`)
+    - **Clear Master Data Cache**: Make the next master data lookups fetch fresh data (`invalidate_master_cache`)
 
     ## Notes
 
     - For detailed usage of each feature, refer to the docstring following the tool name
     - The API connection destination can be configured with the environment variable `API_BASE_URL` (default: http://localhost:8080)
+    - Master data lists are cached for `MASTER_CACHE_TTL` seconds (default: 300, set to 0 to disable)
     """
 
+# Add a basic resource for documentation
+@mcp.resource("docs://overview")
+def get_overview_docs() -> str:
+    """Get overview documentation for the ticket system"""
+    return _OVERVIEW_DOCS
+
 # Run the server
 if __name__ == "__main__":
     logger.info("MCP server starting...")
@@ -995,6 +1287,6 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e:
-        logger.error(f"Server error: {str(e)}")
+        logger.error("Server error: %s", e)
     finally:
         logger.info("MCP server stopped.")